@@ -3,8 +3,11 @@
 import os
 from os import path
 import argparse
+import functools
+import hashlib
 import json
-import tomli, tomli_w
+import re
+import stat
 import dataclasses
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
@@ -12,23 +15,21 @@ from typing import Optional, List
 from utils.misc import ExcludeIfNone, read_build_version, LAUNCHER_VERSION, CONTROL_CODES_SUPPORTED
 from utils.termutils import set_window_title
 from enum import Enum
-from pansi import ansi
 import utils.interface as interface
 import logging
 import sys
-from queue import Queue
+from collections import deque
 import shutil
-from utils import steam
+import threading
 from utils.net import get_request
-from packaging import version
-import astro.playfab as playfab
-from astro.dedicatedserver import AstroDedicatedServer, ServerStatus
 import utils.net as net
 import signal
-import subprocess
-import time
 import traceback
 
+# Heavy modules (astro.playfab, astro.dedicatedserver, utils.steam, packaging, subprocess,
+# tomli/rtoml) are imported lazily in the methods that need them, since module loading
+# dominates cold-start time and commands like 'genconfig' only use a small subset
+
 
 """
 Code based on https://github.com/ricky-davis/AstroLauncher
@@ -36,13 +37,20 @@ Code based on https://github.com/ricky-davis/AstroLauncher
 
 LOGGER = logging.getLogger("Launcher")
 
-BANNER_LOGO = f"""{ansi.weight.bold}
-    {ansi.BLUE}___         __           {ansi.YELLOW}______          
-   {ansi.BLUE}/   |  _____/ /__________{ansi.YELLOW}/_  __/_  ___  __
-  {ansi.BLUE}/ /| | / ___/ __/ ___/ __ \\{ansi.YELLOW}/ / / / / / |/_/
- {ansi.BLUE}/ ___ |(__  ) /_/ /  / /_/ {ansi.YELLOW}/ / / /_/ />  <  
-{ansi.BLUE}/_/  |_/____/\\__/_/   \\____{ansi.YELLOW}/_/  \\__,_/_/|_|  {ansi.reset}
-"""
+# Hardcoded escape sequences for the banner, such that pansi isn't needed just for this
+_BOLD = "\x1b[1m"
+_BLUE = "\x1b[94m"
+_YELLOW = "\x1b[93m"
+_RESET = "\x1b[0m"
+
+# Banner is frozen into bytes once at import, to be written directly to the stdout buffer
+BANNER_LOGO = f"""{_BOLD}
+    {_BLUE}___         __           {_YELLOW}______
+   {_BLUE}/   |  _____/ /__________{_YELLOW}/_  __/_  ___  __
+  {_BLUE}/ /| | / ___/ __/ ___/ __ \\{_YELLOW}/ / / / / / |/_/
+ {_BLUE}/ ___ |(__  ) /_/ /  / /_/ {_YELLOW}/ / / /_/ />  <
+{_BLUE}/_/  |_/____/\\__/_/   \\____{_YELLOW}/_/  \\__,_/_/|_|  {_RESET}
+""".encode()
 BANNER_SUBTITLE = "L a u n c h e r".center(45)
 
 BANNER_TEXT="Unofficial Astroneer Dedicated Server Launcher for Linux"
@@ -87,32 +95,66 @@ class NotificationMethod(Enum):
     NTFY = "ntfy"
     DISCORD = "discord"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscordConfig:
     webhookURL: str = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NTFYConfig:
     topic: str = None
     serverURL: str = "https://ntfy.sh"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationConfig:
     method: NotificationMethod = NotificationMethod.NONE
     name: str = "Astroneer Dedicated Server"
     EventWhitelist: List[interface.EventType] = field(default_factory=lambda: [e for e in interface.EventType])
+    BatchWindowMs: int = 500    # Time window in which bursts of events are batched into a single notification request
     
     discord: Optional[DiscordConfig] = field(metadata=config(exclude=ExcludeIfNone), default=None)
     ntfy: Optional[NTFYConfig] = field(metadata=config(exclude=ExcludeIfNone), default=None)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusConfig:
     SendStatus: bool = False    # Wether to send status updates
     Interval: int = 120         # Interval in which to send status updates
     EndpointURL: str = ""       # URL to send status updates as GET requests to
 
+def _version_newer(new, old):
+    """
+        Returns wether the dotted version string {new} is newer than {old}.
+        Astroneer build versions are plain dotted numerics, so compare them as
+        zero-padded integer tuples instead of paying for packaging.version.
+    """
+
+    try:
+        new_parts = [int(x) for x in new.split(".")]
+        old_parts = [int(x) for x in old.split(".")]
+    except ValueError:
+        # Fall back to packaging for version strings with non-numeric parts
+        from packaging import version
+        return version.parse(new) > version.parse(old)
+
+    # Pad the shorter version with zeros, such that e.g. 1.2 compares equal to 1.2.0
+    length = max(len(new_parts), len(old_parts))
+    new_parts += [0] * (length - len(new_parts))
+    old_parts += [0] * (length - len(old_parts))
+
+    return new_parts > old_parts
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd):
+    """ Memoized shutil.which, such that repeated lookups don't re-scan PATH """
+    return shutil.which(cmd)
+
+# Cache of already parsed launcher configurations keyed by config path
+# Maps each path to (mtime, content hash, config) so unchanged files are not parsed again
+_TOML_CACHE = {}
+
+# The launcher configuration is immutable after loading; overrides create a new
+# instance via dataclasses.replace. Slotted instances are also smaller and faster to access
 @dataclass_json
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LauncherConfig:
     AutoUpdateServer: bool = True   # Wether to automatically install/update the Astroneer DS at start if update is available
     
@@ -134,7 +176,10 @@ class LauncherConfig:
     LogPath: str = "logs"                       # The path where logs should be saved
     
     PlayfabAPIInterval: int = 2                 # Time to wait between Playfab API requests
+    PlayfabAPIIntervalMax: float = 15           # Upper bound for the Playfab API interval while backing off
     ServerStatusInterval: float = 3             # Time to wait between Server Status checks
+    ServerStatusIntervalMax: float = 15         # Upper bound for the Server Status interval while backing off
+    PollBackoffFactor: float = 1.5              # Factor to grow the poll intervals by while nothing changes
     
     DisableEncryption: bool = False             # Wether to disable encryption for the Astroneer DS. CURRENTLY REQUIRED TO BE "True" FOR HOSTING ON LINUX
 
@@ -146,36 +191,73 @@ class LauncherConfig:
             Reads the launcher configuration and fist creates the config file if not present, populated with the default values
         """
         
+        # Prefer the Rust-backed rtoml parser for speed, fall back to pure-Python tomli/tomli_w
+        try:
+            from rtoml import loads as toml_loads, dumps as toml_dumps
+        except ImportError:
+            from tomli import loads as toml_loads
+            from tomli_w import dumps as toml_dumps
+
         config = None
-        
-        if path.exists(config_path):
+        original_bytes = None
+
+        # Use a single stat call to check for existence and file type at once
+        try:
+            config_stat = os.stat(config_path)
+        except FileNotFoundError:
+            config_stat = None
+
+        if config_stat is not None:
             # If config file exists, read it into a config object
-            if not path.isfile(config_path):
+            if not stat.S_ISREG(config_stat.st_mode):
                 raise ValueError("Specified config path doesn't point to a file!")
-            
+
+            # If file is unchanged since it was last parsed, reuse the cached config
+            mtime = config_stat.st_mtime
+            cached = _TOML_CACHE.get(config_path)
+
+            if cached and (cached[0] == mtime):
+                return cached[2]
+
             with open(config_path, "rb") as tf:
-                toml_dict = tomli.load(tf)
-            
+                original_bytes = tf.read()
+
+            content_hash = hashlib.blake2b(original_bytes, digest_size=16).digest()
+
+            # If only the mtime changed but the content is identical, just refresh the cache entry
+            if cached and (cached[1] == content_hash):
+                _TOML_CACHE[config_path] = (mtime, content_hash, cached[2])
+                return cached[2]
+
+            toml_dict = toml_loads(original_bytes.decode())
+
             # If no "launcher" section is present in the file, create it as empty
             if not ("launcher" in toml_dict.keys()):
                 toml_dict = {"launcher": {}}
-            
+
             config = LauncherConfig.from_dict(toml_dict["launcher"])
 
         else:
             # If config file is not present, create directories and default config
             if not path.exists(path.dirname(config_path)):
                 os.makedirs(path.dirname(config_path))
-            
+
             config = LauncherConfig()
-        
+
         # Write config back to file to add missing entried and remove superflous ones
         # In the case of the file not existing prior, it will be created
+        # If the serialized config is identical to the file content, skip the write
         config_dict = {"launcher": config.to_dict(encode_json=True)}
-        
-        with open(config_path, "wb") as tf:
-            tomli_w.dump(config_dict, tf)
-        
+
+        new_bytes = toml_dumps(config_dict).encode()
+
+        if new_bytes != original_bytes:
+            with open(config_path, "wb") as tf:
+                tf.write(new_bytes)
+
+        # Cache the parsed config together with the on-disk state for the next invocation
+        _TOML_CACHE[config_path] = (os.stat(config_path).st_mtime, hashlib.blake2b(new_bytes, digest_size=16).digest(), config)
+
         return config
 
 class AstroTuxLauncher():
@@ -183,6 +265,9 @@ class AstroTuxLauncher():
     def __init__(self, config_path, astro_path, depotdl_exec, force_debug_log=False):
         self.dedicatedserver = None
         self.status_thread = None
+        self._ds_executable_present = False
+        self._buildversion_cache = {}   # Maps installation path to (mtime, version) of its build.version file
+        self._config_dict = None        # Memoized JSON-encoded dict form of the final config
         
         # Setup basic logging
         interface.LauncherLogging.prepare()
@@ -205,27 +290,41 @@ class AstroTuxLauncher():
         
         # If flag was passed, overrule config option
         if force_debug_log:
-            self.config.LogDebugMessages = True
-        
+            self.config = dataclasses.replace(self.config, LogDebugMessages=True)
+
         # Make sure we use absolute paths
-        self.config.AstroServerPath = path.abspath(self.config.AstroServerPath)
-        self.config.WinePrefixPath = path.abspath(self.config.WinePrefixPath)
-        self.config.LogPath = path.abspath(self.config.LogPath)
+        self.config = dataclasses.replace(self.config,
+                                          AstroServerPath=path.abspath(self.config.AstroServerPath),
+                                          WinePrefixPath=path.abspath(self.config.WinePrefixPath),
+                                          LogPath=path.abspath(self.config.LogPath))
         
         # Apply wine path override if possible and check that is exists
-        self.wineexec = shutil.which("wine")
-        self.wineserverexec = shutil.which("wineserver")
-        
+        # Only scan PATH when no usable override is configured
         if self.config.OverrideWinePath and path.isfile(self.config.OverrideWinePath):
             self.wineexec = path.abspath(self.config.OverrideWinePath)
             self.wineserverexec = path.join(path.dirname(self.wineexec), "wineserver")
-        
+        else:
+            self.wineexec = _which("wine")
+            self.wineserverexec = _which("wineserver")
+
         if (self.wineexec is None) or (self.wineserverexec is None):
             LOGGER.error("Wine (or Wineserver) executable not found!")
             LOGGER.error("Make sure that you have wine installed and accessible")
             LOGGER.error("or set 'OverrideWinePath' config option to the path of the wine executable")
             self.exit()
-        
+
+        # Precompute environment and command for running Wineboot once, instead of
+        # copying and patching os.environ on every update_wine_prefix call.
+        # DISPLAY is left out to stop wine from creating a window
+        self._wine_env = {k: v for k, v in os.environ.items() if k != "DISPLAY"}
+        self._wine_env["WINEPREFIX"] = self.config.WinePrefixPath
+        self._wine_env["WINEDEBUG"] = "-all"
+
+        self._wineboot_cmd = [self.wineexec, "wineboot"]
+
+        if self.config.WrapperPath:
+            self._wineboot_cmd.insert(0, self.config.WrapperPath)
+
         # Finish setting up logging
         interface.LauncherLogging.set_log_debug(self.config.LogDebugMessages)
         interface.LauncherLogging.setup_logfile(self.config.LogPath)
@@ -236,11 +335,12 @@ class AstroTuxLauncher():
         
         # If argument is given, file has to exist
         if depotdl_exec:
-            # If {depotdl_exec} is a command, get full path
-            wpath = shutil.which(depotdl_exec)
-            if wpath is not None:
-                depotdl_exec = wpath
-            
+            # If {depotdl_exec} is a command, get full path. Absolute paths skip the PATH scan
+            if not path.isabs(depotdl_exec):
+                wpath = _which(depotdl_exec)
+                if wpath is not None:
+                    depotdl_exec = wpath
+
             if path.isfile(depotdl_exec):
                 self.depotdl_path = path.abspath(depotdl_exec)
                 LOGGER.info(f"DepotDownloader path overridden: {self.depotdl_path}")
@@ -254,11 +354,17 @@ class AstroTuxLauncher():
         
         # Log some information about loaded paths, configs, etc.
         LOGGER.info(f"Working directory: {self.launcherPath}")
-        LOGGER.debug(f"Launcher configuration (including overrides):\n{json.dumps(self.config.to_dict(encode_json=True), indent=4)}")
+
+        # Only serialize the config, if debug logging is enabled at all
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Launcher configuration (including overrides):\n%s", json.dumps(self.get_config_dict(), indent=4))
         
         # Initialize console command parser
+        # A deque plus event is used as the command pipe, since deque append/popleft are
+        # atomic in CPython and skip queue.Queue's lock and condition variable machinery
         self.console_parser = interface.ConsoleParser()
-        self.cmd_queue = Queue()
+        self.cmd_queue = deque()
+        self.cmd_event = threading.Event()
         
         # Initialize Input Thread to handle console input later. Don't start thread just yet
         self.input_thread = interface.KeyboardThread(self.on_input, True)
@@ -273,24 +379,75 @@ class AstroTuxLauncher():
         
         if self.config.notifications.method == NotificationMethod.DISCORD:
             if self.config.notifications.discord.webhookURL:
-                self.notifications.add_handler(interface.DiscordNotificationHandler(self.config.notifications.discord.webhookURL, name=self.config.notifications.name, event_whitelist=set(self.config.notifications.EventWhitelist)))
+                self.notifications.add_handler(interface.DiscordNotificationHandler(self.config.notifications.discord.webhookURL, name=self.config.notifications.name, event_whitelist=set(self.config.notifications.EventWhitelist), batch_window_ms=self.config.notifications.BatchWindowMs))
             else:
                 LOGGER.warning("Discord Webhook URL is not set in config, not sending Discord notifications")
         elif self.config.notifications.method == NotificationMethod.NTFY:
             if self.config.notifications.ntfy.topic:
-                self.notifications.add_handler(interface.NTFYNotificationHandler(self.config.notifications.ntfy.topic, ntfy_url=self.config.notifications.ntfy.serverURL, name=self.config.notifications.name, event_whitelist=set(self.config.notifications.EventWhitelist)))
+                self.notifications.add_handler(interface.NTFYNotificationHandler(self.config.notifications.ntfy.topic, ntfy_url=self.config.notifications.ntfy.serverURL, name=self.config.notifications.name, event_whitelist=set(self.config.notifications.EventWhitelist), batch_window_ms=self.config.notifications.BatchWindowMs))
             else:
                 LOGGER.warning("ntfy topic is not set in config, not sending ntfy notifications")
         
+        # Import server-related modules only when a launcher is actually constructed
+        global playfab, AstroDedicatedServer, ServerStatus
+        import astro.playfab as playfab
+        from astro.dedicatedserver import AstroDedicatedServer, ServerStatus
+
         # Create Dedicated Server object
         self.dedicatedserver = AstroDedicatedServer(self)
     
     def check_ds_executable(self):
         """ Checks is Astroneer DS executable exists and is a file """
-        
+
+        # Positive results are cached, since AstroServerPath doesn't change after __init__
+        # and an installed executable is not expected to disappear again
+        if self._ds_executable_present:
+            return True
+
         execpath = os.path.join(self.config.AstroServerPath, DS_EXECUTABLE)
-        
-        return os.path.exists(execpath) and os.path.isfile(execpath)
+
+        # Use a single stat call to check for existence and file type at once
+        try:
+            self._ds_executable_present = stat.S_ISREG(os.stat(execpath).st_mode)
+        except FileNotFoundError:
+            self._ds_executable_present = False
+
+        return self._ds_executable_present
+
+    def get_config_dict(self):
+        """
+            Returns the JSON-encoded dict form of the launcher config.
+            Since the config is immutable, the reflective to_dict pass only ever runs once per launcher.
+        """
+
+        if self._config_dict is None:
+            self._config_dict = self.config.to_dict(encode_json=True)
+
+        return self._config_dict
+
+    def _cached_build_version(self, astro_path):
+        """
+            Returns the build version of the Astroneer DS installation at {astro_path}.
+            The build.version file is only re-read when its mtime has changed since the last read.
+        """
+
+        verfile_path = path.join(astro_path, "build.version")
+
+        try:
+            mtime = os.stat(verfile_path).st_mtime
+        except FileNotFoundError:
+            self._buildversion_cache.pop(astro_path, None)
+            return None
+
+        cached = self._buildversion_cache.get(astro_path)
+
+        if cached and (cached[0] == mtime):
+            return cached[1]
+
+        buildversion = read_build_version(astro_path)
+        self._buildversion_cache[astro_path] = (mtime, buildversion)
+
+        return buildversion
 
     def on_input(self, input_string):
         """ Callback method to handle console input """
@@ -304,7 +461,8 @@ class AstroTuxLauncher():
                 LOGGER.info(result["message"])
             else:
                 # Add any other command to the command queue to be processed later
-                self.cmd_queue.put(result)
+                self.cmd_queue.append(result)
+                self.cmd_event.set()
         else:
             # If an error occured, {result} is just a message, so log it to console
             # We send event for command first, when it's processed
@@ -315,32 +473,24 @@ class AstroTuxLauncher():
             Creates/updated the WINE prefix
         """
         
+        import subprocess
+
         LOGGER.debug("Ensuring WINE prefix is setup...")
         timeout = self.config.WineBootTimeout
-        cmd = [self.wineexec, "wineboot"]
-
-        if self.config.WrapperPath:
-            cmd.insert(0, self.config.WrapperPath)
+        cmd = self._wineboot_cmd
+        env = self._wine_env
 
-        env = os.environ.copy()
-        
-        # Remove DISPLAY environment variable to stop wine from creating a window
-        if "DISPLAY" in env:
-            del env["DISPLAY"]
-        
-        env["WINEPREFIX"] = self.config.WinePrefixPath
-        env["WINEDEBUG"] = "-all"
-        
         LOGGER.debug(f"Executing command '{' '.join(cmd)}' in WINE prefix '{self.config.WinePrefixPath}'...")
         
         try:
+            # Discard output instead of piping it: it was never read, and a filled pipe
+            # buffer (64 KiB) would block wineboot until the timeout on chatty setups
             wineprocess = subprocess.Popen(
                 cmd,
                 env=env,
                 cwd=self.config.AstroServerPath,
-                stderr=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                close_fds=True
+                stderr=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL
             )
             code = wineprocess.wait(timeout=timeout)  # Use timeout defined from the config value
         except subprocess.TimeoutExpired:
@@ -356,14 +506,25 @@ class AstroTuxLauncher():
         if not self.dedicatedserver:
             raise ValueError("Dedcated Server has to be created first")
         
+        from concurrent.futures import ThreadPoolExecutor
+
         LOGGER.info("Checking Network Configuration...")
-        
-        # Check if server port is reachable from local network over UDP
-        server_local_reachable = net.net_test_local(self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.engine_config.Port, False)
-        
-        # Check if server post is reachable from internet over UDP
-        server_nonlocal_reachable = net.net_test_nonlocal(self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.engine_config.Port)
-        
+
+        # The probes are independent I/O-bound waits, so overlap them instead of paying
+        # each timeout sequentially. Only the two server port probes have to stay
+        # sequential relative to each other, since both bind the same local UDP port
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Check if the RCON port is reachable from the local network over TCP
+            rcon_future = executor.submit(net.net_test_local, self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.ds_config.ConsolePort, True)
+
+            # Check if server port is reachable from local network over UDP
+            server_local_reachable = net.net_test_local(self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.engine_config.Port, False)
+
+            # Check if server post is reachable from internet over UDP
+            server_nonlocal_reachable = net.net_test_nonlocal(self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.engine_config.Port)
+
+            rcon_local_blocked = not rcon_future.result()
+
         test_res = (server_local_reachable, server_nonlocal_reachable)
         
         if test_res == (True, True):
@@ -378,17 +539,18 @@ class AstroTuxLauncher():
             LOGGER.warning("The Server is completely unreachable")
             LOGGER.warning(f"Make sure the Server Port ({self.dedicatedserver.engine_config.Port}) is forwarded for UDP traffic and check firewall settings")
         
-        rcon_local_blocked = not net.net_test_local(self.dedicatedserver.ds_config.PublicIP, self.dedicatedserver.ds_config.ConsolePort, True)
-        
         if rcon_local_blocked:
             LOGGER.info("RCON network configuration looks good")
         else:
             LOGGER.warning(f"SECURITY ALERT: The RCON Port ({self.dedicatedserver.ds_config.ConsolePort}) is accessible from outside")
             LOGGER.warning("SECURITY ALERT: This potentially allows access to the Remote Console from outside your network")
             LOGGER.warning("SECURITY ALERT: Disable this ASAP to prevent issues")
-            
-            # kept from AstroLauncher
-            time.sleep(5)
+
+            # Re-emit the warning a bit later instead of blocking startup for 5 seconds
+            # (AstroLauncher used a plain sleep here to make the alert harder to miss)
+            timer = threading.Timer(5.0, lambda: LOGGER.warning(f"SECURITY ALERT: Reminder: The RCON Port ({self.dedicatedserver.ds_config.ConsolePort}) is still accessible from outside, please address this immediately"))
+            timer.daemon = True
+            timer.start()
     
     def update_server(self):
         """
@@ -396,6 +558,8 @@ class AstroTuxLauncher():
             Also ensures that DepotDownloader is present
         """
         
+        from utils import steam
+
         # If DepotDownloader executable doesn't exists yet, download it
         if not path.exists(self.depotdl_path):
             LOGGER.info("DepotDownloader not found, downloading...")
@@ -403,8 +567,11 @@ class AstroTuxLauncher():
         
         LOGGER.info("Updating Astroneer Dedicated Server app from Steam...")
         success = steam.update_app(exec_path=self.depotdl_path, app="728470", os="windows", directory=self.config.AstroServerPath)
-        
-        self.buildversion = read_build_version(self.config.AstroServerPath)
+
+        # Invalidate the cached version explicitly, since the update just replaced the installation
+        self._buildversion_cache.pop(self.config.AstroServerPath, None)
+
+        self.buildversion = self._cached_build_version(self.config.AstroServerPath)
         
         if success and (self.buildversion is not None):
             LOGGER.info(f"Sucessfully updated Astroneer Dedicated Server to version {self.buildversion}")
@@ -417,7 +584,7 @@ class AstroTuxLauncher():
             Also performs update if set in config or {force_update} is set to True
         """
         
-        oldversion = read_build_version(self.config.AstroServerPath)
+        oldversion = self._cached_build_version(self.config.AstroServerPath)
         
         do_update = False
         installed = True
@@ -430,10 +597,17 @@ class AstroTuxLauncher():
         else:
             # Get current server version from Spycibot endpoint
             try:
-                data = json.load(get_request(ASTRO_SERVER_STATS_URL))
-                newversion = data["stats"]["latestVersion"]
-                
-                if version.parse(newversion) > version.parse(oldversion):
+                # Only the latestVersion field is needed, so extract it directly
+                # instead of parsing the whole stats blob as JSON
+                body = get_request(ASTRO_SERVER_STATS_URL).read()
+                match = re.search(rb'"latestVersion"\s*:\s*"([^"]+)"', body)
+
+                if match is None:
+                    raise ValueError("Response didn't contain a 'latestVersion' field")
+
+                newversion = match.group(1).decode()
+
+                if _version_newer(newversion, oldversion):
                     LOGGER.warning(f"Astroneer Dedicated Server update available ({oldversion} -> {newversion})")
                     do_update = True
             except Exception as e:
@@ -544,19 +718,18 @@ class AstroTuxLauncher():
             if self.dedicatedserver:
                 self.dedicatedserver.kill()
             
-            # Give short time to send status update
+            # Give short time to send status update, but don't wait if there is nothing to send
             if self.status_thread:
                 self.status_thread.update_status(status=False, message="Server was forcibly closed")
-            
-            time.sleep(0.1)
-            
+                self.status_thread.flush(timeout=0.1)
+
             sys.exit(1)
 
 if __name__ == "__main__":
-    # Exit directly, if python version below 3.9 is discovered
-    if (sys.version_info.major < 3) or ((sys.version_info.major == 3) and (sys.version_info.minor < 9)):
+    # Exit directly, if python version below 3.10 is discovered
+    if (sys.version_info.major < 3) or ((sys.version_info.major == 3) and (sys.version_info.minor < 10)):
         print()
-        print("ERROR:   AstroTuxLauncher needs at least Python 3.9 to run properly!")
+        print("ERROR:   AstroTuxLauncher needs at least Python 3.10 to run properly!")
         print(f"        You are currently running version {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}.")
         print()
         sys.exit(1)
@@ -577,7 +750,7 @@ if __name__ == "__main__":
         set_window_title(f"{NAME} - Unofficial Astroneer Dedicated Server Launcher for Linux")
     
     # Print Banner
-    print(BANNER_LOGO, end="")
+    sys.stdout.buffer.write(BANNER_LOGO)
     print(BANNER_SUBTITLE)
     print("")
     print(BANNER_TEXT)
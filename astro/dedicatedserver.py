@@ -403,6 +403,10 @@ class AstroDedicatedServer:
         
         # Stores the time the last status update was performed
         self.last_server_status = None
+
+        # Current adaptive interval between Server Status checks.
+        # Grows by PollBackoffFactor while the server state is unchanged and resets on activity
+        self.server_status_interval = self.launcher.config.ServerStatusInterval
         
         # Load configuration
         ds_config_path = path.join(self.astro_path, ASTRO_DS_CONFIG_PATH, "AstroServerSettings.ini")
@@ -411,8 +415,10 @@ class AstroDedicatedServer:
         self.ds_config = DedicatedServerConfig.ensure_config(ds_config_path, self.launcher.config.OverwritePublicIP)
         self.engine_config = EngineConfig.ensure_config(engine_config_path, self.launcher.config.DisableEncryption)
         
-        LOGGER.debug(f"Dedicated Server configuration (including overrides):\n{json.dumps(self.ds_config.to_dict(encode_json=True), indent=4)}")
-        LOGGER.debug(f"Engine configuration (including overrides):\n{json.dumps(self.engine_config.to_dict(encode_json=True), indent=4)}")
+        # Only serialize the configs, if debug logging is enabled at all
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Dedicated Server configuration (including overrides):\n%s", json.dumps(self.ds_config.to_dict(encode_json=True), indent=4))
+            LOGGER.debug("Engine configuration (including overrides):\n%s", json.dumps(self.engine_config.to_dict(encode_json=True), indent=4))
         
         # Hint about client configuration if encryption is disabled on the server
         if not self.engine_config.AllowEncryption:
@@ -508,7 +514,7 @@ class AstroDedicatedServer:
                 else:
                     LOGGER.warning("Getting information from Dedicated Server failed!")
                 
-            elif (time.time() - self.last_server_status) >= self.launcher.config.ServerStatusInterval:
+            elif (time.time() - self.last_server_status) >= self.server_status_interval:
                 # If the time interval since the last status update is big wnough, do another one
                 update_server_data = True
             
@@ -541,7 +547,10 @@ class AstroDedicatedServer:
                     
                     if self.update_server_info():
                         self.last_server_status = time.time()
-                        
+
+                        # Tracks if anything happened since the last poll, for the adaptive interval
+                        state_changed = False
+
                         online_players = [pi for pi in self.curr_player_list.playerInfo if pi.inGame]
                         online_player_guids = [pi.playerGuid for pi in online_players]
                         
@@ -552,11 +561,12 @@ class AstroDedicatedServer:
                             
                             # Maybe redundant check
                             if len(player_diff_guid) > 0:
+                                state_changed = True
                                 player_diff = [{"name": pi.playerName, "guid": pi.playerGuid} for pi in self.curr_player_list.playerInfo if pi.playerGuid in player_diff_guid]
-                                
+
                                 for info in player_diff:
                                     self.launcher.notifications.send_event(EventType.PLAYER_JOIN, player_name=info["name"], player_guid=info["guid"], server_version=self.build_version)
-                                    
+
                                     #TODO: Maybe set players to pending with command and refresh config file
 
                         # If the amount of players now is smaller than before the update, players have left
@@ -566,8 +576,9 @@ class AstroDedicatedServer:
                             
                             # Maybe redundant check
                             if len(player_diff_guid) > 0:
+                                state_changed = True
                                 player_diff = [{"name": pi.playerName, "guid": pi.playerGuid} for pi in self.curr_player_list.playerInfo if pi.playerGuid in player_diff_guid]
-                                
+
                                 for info in player_diff:
                                     self.launcher.notifications.send_event(EventType.PLAYER_LEAVE, player_name=info["name"], player_guid=info["guid"], server_version=self.build_version)
                         
@@ -582,11 +593,19 @@ class AstroDedicatedServer:
                         
                         # If active save names are different, the server changed savegame
                         if active_save_name != prev_active_save_name:
+                            state_changed = True
                             self.launcher.notifications.send_event(EventType.SAVEGAME_CHANGE, savegame_name=active_save_name, server_version=self.build_version)
                         else:
                             # If save was not changed, check if server saved the game
                             if active_save_time != prev_active_save_time:
+                                state_changed = True
                                 self.launcher.notifications.send_event(EventType.SAVE, savegame_name=active_save_name, server_version=self.build_version)
+
+                        # Back off the status poll interval while nothing changes, reset it on activity
+                        if state_changed:
+                            self.server_status_interval = self.launcher.config.ServerStatusInterval
+                        else:
+                            self.server_status_interval = min(self.server_status_interval * self.launcher.config.PollBackoffFactor, self.launcher.config.ServerStatusIntervalMax)
                     else:
                         LOGGER.error("Error while getting data from dedicated server")
                 except Exception as e:
@@ -595,8 +614,8 @@ class AstroDedicatedServer:
             
             
             # Handle console commands in queue
-            while not self.launcher.cmd_queue.empty():                
-                args = self.launcher.cmd_queue.get()
+            while self.launcher.cmd_queue:
+                args = self.launcher.cmd_queue.popleft()
                 
                 
                 #TODO: Change functions in server such that they return a boolean AND a message, which makes logging easier
@@ -753,9 +772,11 @@ class AstroDedicatedServer:
                     CMD_LOGGER.error(f"Error occured while executing command: {str(e)}")
                     CMD_LOGGER.error(traceback.format_exc())
             
-            # If we didn't do an update, wait a short while. This reduces the CPU usage of the launcher
+            # If we didn't do an update, wait a short while. This reduces the CPU usage of the launcher.
+            # Waiting on the command event instead of sleeping lets new console commands be handled immediately
             if not update_server_data:
-                time.sleep(0.005)
+                self.launcher.cmd_event.wait(timeout=0.005)
+                self.launcher.cmd_event.clear()
         
         # Kill remaining wine processes
         self.kill()
@@ -795,8 +816,10 @@ class AstroDedicatedServer:
         
         LOGGER.info(f"Started Dedicated Server process (v{str(self.build_version)}). Waiting for registration...")
         
-        wait_time = self.launcher.config.PlayfabAPIInterval
-        
+        # Adaptive wait time between Playfab registration checks.
+        # Backs off by PollBackoffFactor while the server is not registered yet
+        api_interval = self.launcher.config.PlayfabAPIInterval
+
         # Wait for DS to finish registration
         with alive_bar(title="Waiting for Dedicated Server to register with Playfab", spinner=AP_SPINNER, bar=None, receipt=True, enrich_print=False, monitor=False, stats=False, force_tty=CONTROL_CODES_SUPPORTED) as bar:
             while not self.registered:
@@ -835,7 +858,8 @@ class AstroDedicatedServer:
                     
                     # If the set of lobbyIDs without the old ones is empty, the server hasn't registered yet
                     if len(set(lobbyIDs) - set(old_lobbyIDs)) == 0:
-                        time.sleep(self.launcher.config.PlayfabAPIInterval)
+                        time.sleep(api_interval)
+                        api_interval = min(api_interval * self.launcher.config.PollBackoffFactor, self.launcher.config.PlayfabAPIIntervalMax)
                     else:
                         now = time.time()
                         
@@ -854,15 +878,11 @@ class AstroDedicatedServer:
                 except:
                     # kept from AstroLauncher
                     LOGGER.debug("Checking for registration failed. Probably rate limit, Backing off and trying again...")
-                    
-                    # If Playfab API wait time is below 30 seconds, increase it by one
-                    if self.launcher.config.PlayfabAPIInterval < 30:
-                        self.launcher.config.PlayfabAPIInterval += 1
-                    
-                    time.sleep(self.launcher.config.PlayfabAPIInterval)
-        
-        self.launcher.config.PlayfabAPIInterval = wait_time
-        
+
+                    api_interval = min(api_interval * self.launcher.config.PollBackoffFactor, self.launcher.config.PlayfabAPIIntervalMax)
+
+                    time.sleep(api_interval)
+
         done_time = time.time()
         elapsed = done_time - start_time
         
@@ -142,32 +142,49 @@ class INIMultiConfig():
     
     def write_file(self, configPath):
         """
-            Writes the configuration to the specified file
-            
+            Writes the configuration to the specified file.
+            The write is skipped, if the file already contains the exact same content.
+
             Arguments:
                 - configPath: Path where the config file should be written
                 - overwrite: Wether an error should be thrown, if the file already esists(False) or not(True)
         """
-        
+
         encoding = INIMultiConfig.get_encoding(configPath)
-        
+
+        # Serialize into memory first, such that the write can be skipped when nothing changed
+        lines = []
+
+        for section in self._dict.keys():
+            # Write section header to file
+            lines.append(f"[{section}]\n")
+
+            properties = self._dict[section]
+
+            # Write one line for each key or multiple for multi-values keys
+            for key, value in properties.items():
+                if isinstance(value, list):
+                    for item in value:
+                        lines.append(f"{key}={item}\n")
+                else:
+                    lines.append(f"{key}={value}\n")
+
+            # Insert newline after each section and at the end of the file
+            lines.append("\n")
+
+        content = "".join(lines)
+
+        # If the on-disk content is already identical, skip the write to avoid
+        # needless disk I/O and mtime churn
+        try:
+            with open(configPath, "r", encoding=encoding) as cf:
+                if cf.read() == content:
+                    return
+        except (OSError, ValueError):
+            pass
+
         with open(configPath, "w", encoding=encoding) as cf:
-            for section in self._dict.keys():
-                # Write section header to file
-                cf.write(f"[{section}]\n")
-                
-                properties = self._dict[section]
-                
-                # Write one line for each key or multiple for multi-values keys
-                for key, value in properties.items():
-                    if isinstance(value, list):
-                        for item in value:
-                            cf.write(f"{key}={item}\n")
-                    else:
-                        cf.write(f"{key}={value}\n")
-                
-                # Insert newline after each section and at the end of the file
-                cf.write("\n")
+            cf.write(content)
     
     def clear(self):
         """ Clears the config """
@@ -678,62 +678,83 @@ class NotificationHandler:
 
 class QueuedNotificationHandler(NotificationHandler):
     """
-        Notification handler that uses a thread and a queue to handle events asynchronously
-        
+        Notification handler that uses a thread and a queue to handle events asynchronously.
+        Events arriving within {batch_window_ms} of each other are collected and handled as one batch.
+
         Arguments:
             - name: see NotificationHandler class
             - event_whitelist: see NotificationHandler class
             - event_formats: see NotificationHandler class
+            - batch_window_ms: Time window (in milliseconds) to collect bursts of events into a single batch
     """
-    
+
     class NotificationThread(threading.Thread):
-        def __init__(self, callback, name="notification-thread"):
+        def __init__(self, callback, batch_window=0.5, name="notification-thread"):
             self.callback = callback
+            self.batch_window = batch_window
             self.event_queue = Queue()
             self.wakeup_event = threading.Event()
-            
+
             super(QueuedNotificationHandler.NotificationThread, self).__init__(name=name)
             self.daemon = True
             self.start()
-        
+
         def add_event(self, event_type, message):
             """ Add an event to the internal queue """
             self.event_queue.put((event_type, message))
             self.wakeup_event.set()
-        
+
         def run(self):
             while True:
                 if not self.event_queue.empty():
-                    # If the queue is not empty, there are events to handle
-                    event = self.event_queue.get()
-                    self.callback(*event)
+                    # Wait out the batch window first, such that bursts of events end up in one batch
+                    if self.batch_window > 0:
+                        time.sleep(self.batch_window)
+
+                    # Drain all events that have queued up by now and handle them as one batch
+                    events = []
+
+                    while not self.event_queue.empty():
+                        events.append(self.event_queue.get())
+
+                    self.callback(events)
                 else:
                     # If queue is empty, sleep for 10s or until the wakeup_event is set
                     self.wakeup_event.wait(timeout=10)
                     self.wakeup_event.clear()
-    
-    def __init__(self, name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS):
+
+    def __init__(self, name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS, batch_window_ms=500):
         super().__init__(name, event_whitelist, event_formats)
-        
-        self.thread = QueuedNotificationHandler.NotificationThread(self._send_message)
-    
+
+        self.thread = QueuedNotificationHandler.NotificationThread(self._send_messages, batch_window=batch_window_ms / 1000)
+
     def send_event(self, event_type=EventType.MESSAGE, **params):
         """ Send event using the provided parameters """
-        
+
         # Only send, if event is in whitelist
         if event_type in self.whitelist:
             # Add server name to parameters for formatting
             params["name"] = self.name
             message = safeformat(self.formats[event_type], **params)
-            
+
             self.thread.add_event(event_type, message)
-    
+
+    def _send_messages(self, events):
+        """
+            Method for handling a batch of events asynchronously.
+            By default, each event is handled separately using _send_message.
+            Can be overwritten by subclasses whose endpoint supports batched sending.
+        """
+
+        for event_type, message in events:
+            self._send_message(event_type, message)
+
     def _send_message(self, event_type, message):
         """
             Method for handling events asynchronously.
             To be overritten by subclasses.
         """
-        
+
         time.sleep(3)
         print(message)
 
@@ -841,38 +862,60 @@ class DiscordNotificationHandler(QueuedNotificationHandler):
     """
         Queued Notification handler that sends event messages to a discord webhook
     """
-    
-    def __init__(self, webhook_url, name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS, extra_formats=DISCORD_EVENT_EXTRA_MAPPING):
+
+    # Discord allows at most 10 embeds per webhook request
+    MAX_EMBEDS_PER_REQUEST = 10
+
+    def __init__(self, webhook_url, name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS, extra_formats=DISCORD_EVENT_EXTRA_MAPPING, batch_window_ms=500):
         self.webhook_url = webhook_url
         self.extra_mapping = extra_formats
-        
+
         # This is to prevent overriding default constants
         event_formats = event_formats.copy()
-        
+
         # Add message formats to Discord Message template
         for et in EventType:
             event_formats[et] = safeformat(DISCORD_MESSAGE_TEMPLATE, message=event_formats[et])
-        
-        super().__init__(name, event_whitelist, event_formats)
-        
+
+        super().__init__(name, event_whitelist, event_formats, batch_window_ms=batch_window_ms)
+
         self.logger = logging.getLogger("DiscordNotify")
-        
+
         self.logger.debug(f"Event Whitelist: {list(self.whitelist)}")
-    
-    def _send_message(self, event_type, message):
+
+    def _build_payload(self, event_type, message):
+        """ Formats the message template into the final webhook payload dictionary """
+
         extra = self.extra_mapping[event_type]
-        
+
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        
+
         message_json = safeformat(message, keep_escape=False, event_type=event_type.value, color=extra["color"], emoji=extra["emoji"], launcher_version=LAUNCHER_VERSION, timestamp=timestamp)
-        
+
         # Normalize JSON
-        message_json = json.loads(message_json)
-        
-        try:
-            resp = net.post_request(self.webhook_url, headers=DISCORD_HEADERS, jsonData=message_json)
-        except Exception as e:
-            self.logger.error(f"Error while sending Discord notification: {str(e)}")
+        return json.loads(message_json)
+
+    def _send_messages(self, events):
+        """ Sends a batch of events as webhook requests containing up to MAX_EMBEDS_PER_REQUEST embeds each """
+
+        payloads = [self._build_payload(event_type, message) for event_type, message in events]
+
+        for i in range(0, len(payloads), DiscordNotificationHandler.MAX_EMBEDS_PER_REQUEST):
+            chunk = payloads[i:i + DiscordNotificationHandler.MAX_EMBEDS_PER_REQUEST]
+
+            # Merge the embeds of the whole chunk into the first payload
+            merged = chunk[0]
+
+            for payload in chunk[1:]:
+                merged["embeds"].extend(payload["embeds"])
+
+            try:
+                resp = net.post_request(self.webhook_url, headers=DISCORD_HEADERS, jsonData=merged)
+            except Exception as e:
+                self.logger.error(f"Error while sending Discord notification: {str(e)}")
+
+    def _send_message(self, event_type, message):
+        self._send_messages([(event_type, message)])
 
 NTFY_MESSAGE_TEMPLATE = """{{
     "topic": "{topic}",
@@ -910,19 +953,19 @@ class NTFYNotificationHandler(QueuedNotificationHandler):
         Queued Notificationm handler that sends event messages to an ntfy instance
     """
     
-    def __init__(self, topic, ntfy_url="https://ntfy.sh", name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS, extra_formats=NTFY_EVENT_EXTRA_MAPPING):
+    def __init__(self, topic, ntfy_url="https://ntfy.sh", name="Server", event_whitelist=set([e for e in EventType]), event_formats=DEFAULT_EVENT_FORMATS, extra_formats=NTFY_EVENT_EXTRA_MAPPING, batch_window_ms=500):
         self.topic = topic
         self.ntfy_url = ntfy_url
         self.extra_mapping = extra_formats
-        
+
         # This is to prevent overriding default constants
         event_formats = event_formats.copy()
-        
+
         # Add message formats to Discord Message template
         for et in EventType:
             event_formats[et] = safeformat(NTFY_MESSAGE_TEMPLATE, message=event_formats[et], topic=self.topic)
-        
-        super().__init__(name, event_whitelist, event_formats)
+
+        super().__init__(name, event_whitelist, event_formats, batch_window_ms=batch_window_ms)
         
         self.logger = logging.getLogger("NTFYNotify")
         
@@ -998,6 +1041,11 @@ class StatusUpdaterThread(threading.Thread):
         
         self._update_event = threading.Event()
         self._stop_event = threading.Event()
+
+        # Set while no status update is pending, for use by flush()
+        self._idle_event = threading.Event()
+        self._idle_event.set()
+
         self.logger = logging.getLogger(name)
         
         super(StatusUpdaterThread, self).__init__(name=name)
@@ -1005,10 +1053,25 @@ class StatusUpdaterThread(threading.Thread):
     
     def stop(self):
         self._stop_event.set()
-    
+
+        # Wake the thread up, such that it exits promptly instead of waiting for the heartbeat
+        self._update_event.set()
+
     def stopped(self):
         return self._stop_event.is_set()
-    
+
+    def flush(self, timeout=0.1):
+        """
+            Waits for a pending status update to be sent, but at most {timeout} seconds.
+            Returns immediately, if nothing is pending or the thread isn't running.
+            Returns True, if no update is pending anymore.
+        """
+
+        if not self.is_alive():
+            return True
+
+        return self._idle_event.wait(timeout=timeout)
+
     def update_status(self, status, message=None):
         changed = False
         
@@ -1022,6 +1085,7 @@ class StatusUpdaterThread(threading.Thread):
         
         # If something changed, trigger sending of status update
         if changed:
+            self._idle_event.clear()
             self._update_event.set()
     
     def _send_current_status(self):
@@ -1060,17 +1124,21 @@ class StatusUpdaterThread(threading.Thread):
             return False
     
     def run(self):
-        """ Sends status update and waits for either event to fire or timeout seconds """
-        
-        while True:
-            # Exit the loop, if requested to stop
-            if self._stop_event.is_set():
-                break
-            
+        """
+            Sends a status update on every state transition and otherwise only a heartbeat every {timeout} seconds.
+            Intermediate updates between two sends are coalesced into a single request containing the latest state.
+        """
+
+        while not self._stop_event.is_set():
+            # Clear before sending, such that updates arriving during the send trigger another one immediately
+            self._update_event.clear()
+
             # Send actual status update
             self._send_current_status()
-            
-            
-            # Wait until update event fires or timeout seconds
-            self._update_event.wait(timeout=self.timeout)
-            self._update_event.clear()
\ No newline at end of file
+
+            # Mark the thread as idle, unless another update arrived while sending
+            if not self._update_event.is_set():
+                self._idle_event.set()
+
+            # Wait until update event fires (state transition) or the heartbeat timeout elapses
+            self._update_event.wait(timeout=self.timeout)
\ No newline at end of file
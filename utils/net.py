@@ -2,11 +2,8 @@
 # This file is heavily based upon code from [AstroLauncher](https://github.com/ricky-davis/AstroLauncher)
 #
 
+import io
 import json
-import urllib
-import urllib.error
-from urllib import request
-import ssl
 import time
 import socket
 import secrets
@@ -14,72 +11,58 @@ import threading
 import logging
 from contextlib import contextmanager
 
+import requests
+
+from utils.misc import LAUNCHER_VERSION
+
 import traceback
 
 LOGGER = logging.getLogger("Net")
 
+# Session shared by all HTTP requests, such that connection keep-alive and TLS session
+# reuse avoid a fresh TCP+TLS handshake per call. System proxies are honored by default
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": f"AstroTuxLauncher/{LAUNCHER_VERSION}"})
+
 def get_request(url, timeout=5):
     """
-        Perform a GET request to {url} while using system spefified proxies and SSL.
-    
+        Perform a GET request to {url} using the shared session.
+
         Arguments:
             - url: The URL to perform the request on
             - [timeout]: Timeout for request
-        
-        Returns: The data response from the request
+
+        Returns: A file-like object containing the response body
     """
-    
-    # Install handler for using specified proxies
-    proxy_handler = request.ProxyHandler(request.getproxies())
-    opener = request.build_opener(proxy_handler)
-    request.install_opener(opener)
-    
-    sslcontext = ssl.SSLContext()
-    
-    # Perform GET request to url
-    response = request.urlopen(url, timeout=timeout, context=sslcontext)
-    
-    return response
+
+    response = _SESSION.get(url, timeout=timeout)
+    response.raise_for_status()
+
+    return io.BytesIO(response.content)
 
 def post_request(url, headers={}, jsonData={}, timeout=5):
     """
         Perform a POST request to {url} using the specified {headers} containing the specified {jsonData}.
-        
+
         Arguments:
             - url: The URL to perform the request on
             - [headers]: A dictionary containing key-value pairs representing the headers to be used for the request and their values
             - [jsonData]: A dictionary containing JSON data to be sent as the content of the request
             - [timeout]: Timeout for the request
-        
-        Returns: The data response from the request or an HTTPError
+
+        Returns: A file-like object containing the response body (also in the case of an HTTP error status)
     """
-    
-    req = request.Request(url)
-    
+
     # Stringify JSON data
     if jsonData != {}:
         jsonString = json.dumps(jsonData).encode("utf-8")
-        req.add_header("Content-Type", "application/json; charset=utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8", **headers}
     else:
         jsonString = b""
-    
-    for header, value in headers.items():
-        req.add_header(header, value)
-    
-    # Install handler for using specified proxies
-    proxy_handler = request.ProxyHandler(request.getproxies())
-    opener = request.build_opener(proxy_handler)
-    request.install_opener(opener)
-    
-    sslcontext = ssl.SSLContext()
-    
-    # Try performing request and if error is caught, return it
-    try:
-        response = request.urlopen(req, data=jsonString, timeout=timeout, context=sslcontext)
-    except urllib.error.HTTPError as e:
-        response = e
-    
-    return response
+
+    response = _SESSION.post(url, data=jsonString, headers=headers, timeout=timeout)
+
+    return io.BytesIO(response.content)
 
 def get_public_ip():
     LOGGER.info("Getting IP from remote service")